@@ -22,16 +22,23 @@ Tools:
 """
 
 import os
+from array import array
+from collections import Counter
+from functools import lru_cache
+from itertools import chain
 
 from qgis.PyQt.QtWidgets import (
     QAction, QDockWidget, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QDialog, QPushButton, QCalendarWidget, QDateEdit, QMessageBox
 )
 from qgis.PyQt.QtGui import QIcon
-from qgis.PyQt.QtCore import Qt, QVariant, QDate, QTimer
+from qgis.PyQt.QtCore import (
+    Qt, QVariant, QDate, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
+)
 
 from qgis.core import (
-    QgsField, QgsVectorLayer, QgsSettings, QgsProject
+    QgsAggregateCalculator, QgsDefaultValue, QgsField, QgsFeatureRequest,
+    QgsVectorLayer, QgsSettings, QgsProject
 )
 
 EDIT_FIELD = "edited"
@@ -40,6 +47,60 @@ DATE_FIELD = "edited_dat"   # shapefile-safe 10 chars
 SETTINGS_GROUP = "EditTrackingTools"
 SETTINGS_KEY_TRACKED_SOURCES = f"{SETTINGS_GROUP}/tracked_sources"
 
+# Providers that execute filtered aggregates as backend SQL. ogr is left out:
+# whether it can push a COUNT down depends on the underlying format, and a
+# non-pushed aggregate means one local pass per counter instead of our single
+# scan.
+DB_PROVIDERS = {"postgres", "mssql", "oracle", "hana", "spatialite"}
+
+
+# numpy ships with QGIS but is optional here, and importing it at module
+# load would count against plugin startup time; resolved on first scan.
+_np = None
+_np_checked = False
+
+
+def _get_numpy():
+    global _np, _np_checked
+    if not _np_checked:
+        _np_checked = True
+        try:
+            import numpy
+            _np = numpy
+        except ImportError:
+            _np = None
+    return _np
+
+
+@lru_cache(maxsize=None)
+def _icon(path):
+    """One cached QIcon per path; avoids re-reading the PNG on reuse."""
+    return QIcon(path)
+
+
+def _fast_request(attr_idxs=None, with_geom=True):
+    """A QgsFeatureRequest limited to the given attribute indexes.
+
+    attr_idxs of None/empty requests no attributes at all; with_geom=False
+    additionally skips geometry fetching/decoding at the provider.
+    """
+    req = QgsFeatureRequest()
+    if attr_idxs:
+        req.setSubsetOfAttributes(list(attr_idxs))
+    else:
+        req.setNoAttributes()
+    if not with_geom:
+        req.setFlags(QgsFeatureRequest.NoGeometry)
+    return req
+
+
+def _safe_disconnect(signal, slot):
+    """Disconnect a slot without raising when it was never connected."""
+    try:
+        signal.disconnect(slot)
+    except Exception:
+        pass
+
 
 def is_null_date(date_val):
     if date_val is None:
@@ -49,15 +110,127 @@ def is_null_date(date_val):
     return False
 
 
-def to_qdate(date_val):
+def to_julian_day(date_val):
+    """Julian day number for a QDate/date-like value, or -1 for null.
+
+    Integer comparison avoids allocating a QDate per feature in the scan
+    and makes the day histogram / numpy date array trivial.
+    """
     if isinstance(date_val, QDate):
-        return date_val if date_val.isValid() else None
+        return date_val.toJulianDay() if date_val.isValid() else -1
     if hasattr(date_val, "year") and hasattr(date_val, "month") and hasattr(date_val, "day"):
         try:
-            return QDate(date_val.year, date_val.month, date_val.day)
+            return QDate(date_val.year, date_val.month, date_val.day).toJulianDay()
         except Exception:
-            return None
-    return None
+            return -1
+    return -1
+
+
+def _make_scanner(edited_type, date_type):
+    """Build a pure-Python stats scanner specialized for a layer's value types.
+
+    A provider returns uniform types across rows, so sampling the first
+    feature lets the common (int, QDate) layout run a tight loop with no
+    casts, try frames, or helper calls. Anything else gets the generic loop.
+    Scanners return (edited_1, edited_0, null_geom, null_attr, date_hist).
+    """
+    if edited_type is int and date_type is QDate:
+        def scanner(features, edited_idx, date_idx):
+            edited_1 = edited_0 = null_geom = null_attr = 0
+            date_hist = Counter()
+            _QDate = QDate
+            for f in features:
+                g = f.geometry()
+                if g is None or g.isEmpty() or g.isNull():
+                    null_geom += 1
+                    continue
+                val = f[edited_idx]
+                if val == 1:
+                    dv = f[date_idx]
+                    if type(dv) is _QDate and dv.isValid():
+                        edited_1 += 1
+                        date_hist[dv.toJulianDay()] += 1
+                    else:
+                        null_attr += 1
+                elif val == 0:
+                    edited_0 += 1
+                else:
+                    null_attr += 1
+            return edited_1, edited_0, null_geom, null_attr, date_hist
+    else:
+        def scanner(features, edited_idx, date_idx):
+            edited_1 = edited_0 = null_geom = null_attr = 0
+            date_hist = Counter()
+            _is_null_date = is_null_date
+            _to_jd = to_julian_day
+            _QDate = QDate
+            for f in features:
+                g = f.geometry()
+                if g is None or g.isEmpty() or g.isNull():
+                    null_geom += 1
+                    continue
+
+                val = f[edited_idx]
+                if type(val) is int:
+                    v = val
+                elif val is None:
+                    null_attr += 1
+                    continue
+                else:
+                    try:
+                        v = int(val)
+                    except Exception:
+                        null_attr += 1
+                        continue
+
+                if v not in (0, 1):
+                    null_attr += 1
+                    continue
+
+                if v == 1:
+                    date_val = f[date_idx]
+                    if _is_null_date(date_val):
+                        null_attr += 1
+                    else:
+                        edited_1 += 1
+                        if type(date_val) is _QDate:
+                            jd = date_val.toJulianDay()
+                        else:
+                            jd = _to_jd(date_val)
+                        if jd >= 0:
+                            date_hist[jd] += 1
+                else:
+                    edited_0 += 1
+            return edited_1, edited_0, null_geom, null_attr, date_hist
+
+    return scanner
+
+
+class _StatsWorkerSignals(QObject):
+    done = pyqtSignal(dict)
+
+
+class _StatsWorker(QRunnable):
+    """Runs the full-table stats scan off the GUI thread.
+
+    getFeatures with an independent request is thread-safe in QGIS >= 3.0,
+    so the scan no longer blocks canvas repaints while editing.
+    """
+
+    def __init__(self, plugin, layer, gen):
+        super().__init__()
+        self._plugin = plugin
+        self._layer = layer
+        self._gen = gen
+        self.signals = _StatsWorkerSignals()
+
+    def run(self):
+        payload = {"layer_id": self._layer.id(), "gen": self._gen, "stats": None}
+        try:
+            payload["stats"] = self._plugin._scan_layer_stats(self._layer)
+        except Exception:
+            pass
+        self.signals.done.emit(payload)
 
 
 class EditTrackingToolsPlugin:
@@ -80,10 +253,38 @@ class EditTrackingToolsPlugin:
         # Settings storage of previously tracked layers (by layer.source())
         self.settings = QgsSettings()
 
+        # In-memory mirror of the tracked-sources setting. QSettings is read
+        # once here; writes are coalesced through a deferred flush timer so
+        # repeated tracking toggles never hit the registry/INI directly.
+        # Stored as one newline-joined string — list-typed QSettings values
+        # are written as one key per element, which is needless I/O.
+        try:
+            raw = self.settings.value(SETTINGS_KEY_TRACKED_SOURCES, "", type=str) or ""
+            self._tracked_sources_cache = set(raw.split("\n")) - {""}
+        except Exception:
+            # migrate from the old list-typed storage
+            val = self.settings.value(SETTINGS_KEY_TRACKED_SOURCES, [], type=list)
+            self._tracked_sources_cache = set(val or [])
+        self._sources_flush_timer = QTimer()
+        self._sources_flush_timer.setSingleShot(True)
+        self._sources_flush_timer.timeout.connect(self._flush_tracked_sources)
+
         # UI
         self.dock = None
         self.stats_label = None
         self.day_date_edit = None
+        self._date_debounce = None
+
+        # per-stat labels + last rendered values (setText only on change)
+        self._stat_rows = None
+        self.lbl_total = None
+        self.lbl_e1 = None
+        self.lbl_e0 = None
+        self.lbl_day_caption = None
+        self.lbl_day = None
+        self.lbl_null_geom = None
+        self.lbl_null_attr = None
+        self._last_stats = {}
 
         # actions
         self.action_create_field = None
@@ -94,6 +295,26 @@ class EditTrackingToolsPlugin:
         self.action_select_null = None
         self.action_stats = None
 
+        # Cached scan results per layer id; entries are popped (invalidated)
+        # whenever the layer data changes, so a clean layer never rescans.
+        self._stats_cache = {}
+
+        # Per-layer invalidation generation + in-flight flag for the
+        # background scan worker (latest-wins: stale results are discarded).
+        self._stats_gen = {}
+        self._stats_worker_active = False
+
+        # layer.id() -> (edited_idx, date_idx); filled only for layers whose
+        # updatedFields signal is hooked (see _field_indexes)
+        self._field_idx_cache = {}
+
+        # layer.id() -> type-specialized scan function (see _make_scanner)
+        self._scanners = {}
+
+        # Set when a refresh was requested while the dock was hidden, so the
+        # catch-up scan runs once the dock becomes visible again
+        self._stats_dirty = False
+
         # Throttle stats refresh (prevents freezes while editing)
         self._stats_timer = QTimer()
         self._stats_timer.setSingleShot(True)
@@ -102,56 +323,56 @@ class EditTrackingToolsPlugin:
         # Track which layer has edit signals connected (avoid duplicates)
         self._edit_signal_connected_layer_id = None
 
+        # Date stamped on auto-marked features, fixed once per edit session
+        # so bulk imports don't hit the clock per feature and all edits of a
+        # session carry the same date
+        self._today = None
+
     # ---------------- GUI INIT ----------------
     def initGui(self):
         self.toolbar = self.iface.addToolBar("Edit Tracking")
         self.toolbar.setObjectName("EditTrackingToolbar")
 
-        # ICONS
-        icon_create = QIcon(os.path.join(self.plugin_dir, "icons", "create_edited_24.png"))
-        icon_auto = QIcon(os.path.join(self.plugin_dir, "icons", "auto_edit_24.png"))
-        icon_mark = QIcon(os.path.join(self.plugin_dir, "icons", "mark_selected_24.png"))
-        icon_update = QIcon(os.path.join(self.plugin_dir, "icons", "update_date_24.png"))
-        icon_remove_null = QIcon(os.path.join(self.plugin_dir, "icons", "remove_null_geom_24.png"))
-        icon_null_attr = QIcon(os.path.join(self.plugin_dir, "icons", "null_attr_24.png"))
-        icon_refresh = QIcon(os.path.join(self.plugin_dir, "icons", "refresh_stats_24.png"))
-
         # 1) Create fields
-        self.action_create_field = QAction(icon_create, "Create Edited Fields and Date", self.iface.mainWindow())
+        self.action_create_field = QAction("Create Edited Fields and Date", self.iface.mainWindow())
         self.action_create_field.triggered.connect(self.create_edited_fields)
         self.toolbar.addAction(self.action_create_field)
 
         # 2) Auto Edit toggle (single button)
-        self.action_auto_toggle = QAction(icon_auto, "Auto Edit (Enable Tracking)", self.iface.mainWindow())
+        self.action_auto_toggle = QAction("Auto Edit (Enable Tracking)", self.iface.mainWindow())
         self.action_auto_toggle.setCheckable(True)
         self.action_auto_toggle.toggled.connect(self.toggle_tracking_for_active_layer)
         self.toolbar.addAction(self.action_auto_toggle)
 
         # 3) Mark selected
-        self.action_mark = QAction(icon_mark, "Mark Selected Edited", self.iface.mainWindow())
+        self.action_mark = QAction("Mark Selected Edited", self.iface.mainWindow())
         self.action_mark.triggered.connect(self.mark_selected_as_edited)
         self.toolbar.addAction(self.action_mark)
 
         # 4) Update date
-        self.action_update_date = QAction(icon_update, "Update Date (Selected)", self.iface.mainWindow())
+        self.action_update_date = QAction("Update Date (Selected)", self.iface.mainWindow())
         self.action_update_date.triggered.connect(self.update_date_for_selected)
         self.toolbar.addAction(self.action_update_date)
 
         # 5) Remove null geom
-        self.action_remove_null_geom = QAction(icon_remove_null, "Remove NULL Geometry", self.iface.mainWindow())
+        self.action_remove_null_geom = QAction("Remove NULL Geometry", self.iface.mainWindow())
         self.action_remove_null_geom.triggered.connect(self.remove_null_geometry)
         self.toolbar.addAction(self.action_remove_null_geom)
 
         # 6) Select null attributes
-        self.action_select_null = QAction(icon_null_attr, "Select NULL Attributes", self.iface.mainWindow())
+        self.action_select_null = QAction("Select NULL Attributes", self.iface.mainWindow())
         self.action_select_null.triggered.connect(self.select_null_attributes)
         self.toolbar.addAction(self.action_select_null)
 
         # 7) Refresh stats
-        self.action_stats = QAction(icon_refresh, "Refresh Stats", self.iface.mainWindow())
-        self.action_stats.triggered.connect(self.update_stats_for_active_layer)
+        self.action_stats = QAction("Refresh Stats", self.iface.mainWindow())
+        self.action_stats.triggered.connect(self.force_refresh_stats)
         self.toolbar.addAction(self.action_stats)
 
+        # ICONS — loaded on the next event-loop turn; Qt only needs the
+        # pixmaps at paint time, so plugin startup skips the 7 PNG reads.
+        QTimer.singleShot(0, self._apply_action_icons)
+
         self.actions.extend([
             self.action_create_field, self.action_auto_toggle, self.action_mark,
             self.action_update_date, self.action_remove_null_geom, self.action_select_null,
@@ -161,11 +382,9 @@ class EditTrackingToolsPlugin:
         # Dock stats
         self.create_stats_dock()
 
-        # Layer change
-        self.iface.currentLayerChanged.connect(self.on_layer_changed)
-
-        # Connect edit signals for active layer (for popup)
-        self.iface.currentLayerChanged.connect(self._connect_edit_signals_for_layer)
+        # Layer change: one connection, multiplexed to both handlers, so the
+        # frequently fired signal crosses the C++/Python boundary once
+        self.iface.currentLayerChanged.connect(self._on_current_layer_changed)
         self._connect_edit_signals_for_layer(self.iface.activeLayer())
 
         # --- Stale layer-id cleanup when layer removed ---
@@ -178,44 +397,46 @@ class EditTrackingToolsPlugin:
 
         self.on_layer_changed(self.iface.activeLayer())
 
+    def _apply_action_icons(self):
+        for act, name in (
+            (self.action_create_field, "create_edited_24.png"),
+            (self.action_auto_toggle, "auto_edit_24.png"),
+            (self.action_mark, "mark_selected_24.png"),
+            (self.action_update_date, "update_date_24.png"),
+            (self.action_remove_null_geom, "remove_null_geom_24.png"),
+            (self.action_select_null, "null_attr_24.png"),
+            (self.action_stats, "refresh_stats_24.png"),
+        ):
+            if act:  # skip if unloaded before the deferred call fires
+                act.setIcon(_icon(os.path.join(self.plugin_dir, "icons", name)))
+
     # ---------------- UNLOAD ----------------
     def unload(self):
-        # disconnect watchers
-        for layer_id, info in list(self.auto_connections.items()):
-            layer = info.get("layer")
-            try:
-                layer.geometryChanged.disconnect(info["geom_fn"])
-            except Exception:
-                pass
+        # write out any tracked source still waiting on the flush timer
+        if self._sources_flush_timer.isActive():
+            self._sources_flush_timer.stop()
+            self._flush_tracked_sources()
+
+        # disconnect watchers (flushing any pending auto-mark batch first)
+        for info in self.auto_connections.values():
             try:
-                layer.featureAdded.disconnect(info["add_fn"])
+                info["flush_fn"]()
             except Exception:
                 pass
+            self._disconnect_auto(info)
 
         self.auto_connections.clear()
+        self._stats_cache.clear()
         self.tracked_layer_ids.clear()
         self._prompted_this_edit_session.clear()
 
-        try:
-            self.iface.currentLayerChanged.disconnect(self.on_layer_changed)
-        except Exception:
-            pass
-        try:
-            self.iface.currentLayerChanged.disconnect(self._connect_edit_signals_for_layer)
-        except Exception:
-            pass
+        _safe_disconnect(self.iface.currentLayerChanged, self._on_current_layer_changed)
 
         prj = QgsProject.instance()
-        try:
-            if hasattr(prj, "layersWillBeRemoved"):
-                prj.layersWillBeRemoved.disconnect(self._on_layers_will_be_removed)
-        except Exception:
-            pass
-        try:
-            if hasattr(prj, "layerWillBeRemoved"):
-                prj.layerWillBeRemoved.disconnect(self._on_layer_will_be_removed)
-        except Exception:
-            pass
+        if hasattr(prj, "layersWillBeRemoved"):
+            _safe_disconnect(prj.layersWillBeRemoved, self._on_layers_will_be_removed)
+        if hasattr(prj, "layerWillBeRemoved"):
+            _safe_disconnect(prj.layerWillBeRemoved, self._on_layer_will_be_removed)
 
         if self.toolbar:
             for act in self.actions:
@@ -229,34 +450,55 @@ class EditTrackingToolsPlugin:
 
     # ---------------- SETTINGS ----------------
     def _get_tracked_sources(self):
-        val = self.settings.value(SETTINGS_KEY_TRACKED_SOURCES, [], type=list)
-        return set(val or [])
+        return self._tracked_sources_cache
 
     def _save_tracked_source(self, layer: QgsVectorLayer):
-        sources = self._get_tracked_sources()
-        sources.add(layer.source())
-        self.settings.setValue(SETTINGS_KEY_TRACKED_SOURCES, sorted(list(sources)))
+        self._tracked_sources_cache.add(layer.source())
+        self._sources_flush_timer.start(2000)
+
+    def _flush_tracked_sources(self):
+        self.settings.setValue(SETTINGS_KEY_TRACKED_SOURCES, "\n".join(self._tracked_sources_cache))
 
     def _is_previously_tracked(self, layer: QgsVectorLayer) -> bool:
         return layer.source() in self._get_tracked_sources()
 
+    # ---------------- STATS CACHE / WORKER ----------------
+    def _invalidate_stats(self, layer_id: str):
+        self._stats_cache.pop(layer_id, None)
+        self._stats_gen[layer_id] = self._stats_gen.get(layer_id, 0) + 1
+
+    def _start_stats_worker(self, layer: QgsVectorLayer):
+        # latest-wins: only one scan in flight; if the layer is edited while
+        # scanning, the stale result is dropped and a fresh scan re-queued.
+        if self._stats_worker_active:
+            return
+        self._stats_worker_active = True
+        worker = _StatsWorker(self, layer, self._stats_gen.get(layer.id(), 0))
+        worker.signals.done.connect(self._on_stats_scanned)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_stats_scanned(self, payload):
+        self._stats_worker_active = False
+        layer_id = payload.get("layer_id")
+        stats = payload.get("stats")
+        if stats is not None and payload.get("gen") == self._stats_gen.get(layer_id, 0):
+            self._stats_cache[layer_id] = stats
+        # re-render (cache hit), or re-queue if invalidated mid-scan
+        self._update_stats_now()
+
     # ---------------- STALE ID CLEANUP ----------------
     def _cleanup_layer_id(self, layer_id: str):
         """Remove stale layer IDs from internal state when layers are removed."""
         self.tracked_layer_ids.discard(layer_id)
         self._prompted_this_edit_session.discard(layer_id)
+        self._stats_cache.pop(layer_id, None)
+        self._stats_gen.pop(layer_id, None)
+        self._field_idx_cache.pop(layer_id, None)
+        self._scanners.pop(layer_id, None)
 
         info = self.auto_connections.pop(layer_id, None)
         if info:
-            layer = info.get("layer")
-            try:
-                layer.geometryChanged.disconnect(info["geom_fn"])
-            except Exception:
-                pass
-            try:
-                layer.featureAdded.disconnect(info["add_fn"])
-            except Exception:
-                pass
+            self._disconnect_auto(info)
 
         if self._edit_signal_connected_layer_id == layer_id:
             self._edit_signal_connected_layer_id = None
@@ -273,27 +515,54 @@ class EditTrackingToolsPlugin:
         layer = self.iface.activeLayer()
         return layer if isinstance(layer, QgsVectorLayer) else None
 
-    def _layer_has_required_fields(self, layer: QgsVectorLayer) -> bool:
+    def _field_indexes(self, layer: QgsVectorLayer):
+        """(edited_idx, date_idx) for the layer, -1 where missing.
+
+        indexFromName copies the fields container and scans names linearly,
+        so the result is cached per layer — but only for layers attached by
+        _attach_auto_for_layer, whose updatedFields signal invalidates it.
+        """
+        layer_id = layer.id()
+        cached = self._field_idx_cache.get(layer_id)
+        if cached is not None:
+            return cached
         fields = layer.fields()
-        return fields.indexFromName(EDIT_FIELD) != -1 and fields.indexFromName(DATE_FIELD) != -1
+        idxs = (fields.indexFromName(EDIT_FIELD), fields.indexFromName(DATE_FIELD))
+        if layer_id in self.auto_connections:
+            self._field_idx_cache[layer_id] = idxs
+        return idxs
+
+    def _layer_has_required_fields(self, layer: QgsVectorLayer) -> bool:
+        edited_idx, date_idx = self._field_indexes(layer)
+        return edited_idx != -1 and date_idx != -1
 
     def _set_tracking_tools_enabled(self, enabled: bool):
         for act in (self.action_mark, self.action_update_date, self.action_remove_null_geom, self.action_select_null):
             if act:
                 act.setEnabled(enabled)
 
+    @staticmethod
+    def _disconnect_auto(info):
+        """Undo the connections recorded by _attach_auto_for_layer."""
+        timer = info.get("flush_timer")
+        if timer is not None:
+            timer.stop()
+        try:
+            for conn in info.get("conns", ()):
+                QObject.disconnect(conn)
+        except Exception:
+            pass
+
     def _detach_auto_for_layer(self, layer: QgsVectorLayer):
         info = self.auto_connections.pop(layer.id(), None)
         if not info:
             return
+        # write out any fids still waiting on the coalescing timer
         try:
-            layer.geometryChanged.disconnect(info["geom_fn"])
-        except Exception:
-            pass
-        try:
-            layer.featureAdded.disconnect(info["add_fn"])
+            info["flush_fn"]()
         except Exception:
             pass
+        self._disconnect_auto(info)
 
     # ---------------- Connect edit signals (popup) ----------------
     def _connect_edit_signals_for_layer(self, layer):
@@ -310,14 +579,8 @@ class EditTrackingToolsPlugin:
         if self._edit_signal_connected_layer_id:
             prev = QgsProject.instance().mapLayer(self._edit_signal_connected_layer_id)
         if isinstance(prev, QgsVectorLayer):
-            try:
-                prev.editingStarted.disconnect(self._on_layer_editing_started)
-            except Exception:
-                pass
-            try:
-                prev.editingStopped.disconnect(self._on_layer_editing_stopped)
-            except Exception:
-                pass
+            _safe_disconnect(prev.editingStarted, self._on_layer_editing_started)
+            _safe_disconnect(prev.editingStopped, self._on_layer_editing_stopped)
 
         try:
             layer.editingStarted.connect(self._on_layer_editing_started)
@@ -331,6 +594,8 @@ class EditTrackingToolsPlugin:
         self._edit_signal_connected_layer_id = layer.id()
 
     def _on_layer_editing_started(self):
+        self._today = QDate.currentDate()
+
         layer = self._active_vector_layer()
         if not layer:
             return
@@ -375,19 +640,27 @@ class EditTrackingToolsPlugin:
             self.update_stats_for_active_layer()
 
     def _on_layer_editing_stopped(self):
+        self._today = None
+
         layer = self._active_vector_layer()
         if not layer:
             return
         # allow popup again next time editing starts
         self._prompted_this_edit_session.discard(layer.id())
+        # committed values can differ from the edit buffer (provider defaults,
+        # partially rejected changes) — rescan once after the session ends
+        self._invalidate_stats(layer.id())
         self.update_stats_for_active_layer()
 
     # ---------------- LAYER CHANGE ----------------
-    def on_layer_changed(self, layer):
-        self.update_stats_for_active_layer()
+    def _on_current_layer_changed(self, layer):
+        self._connect_edit_signals_for_layer(layer)
+        self.on_layer_changed(layer)
 
+    def on_layer_changed(self, layer):
         vlayer = layer if isinstance(layer, QgsVectorLayer) else None
         if not vlayer:
+            # raster/mesh hop: reset the UI, render the header, nothing else
             self._set_tracking_tools_enabled(False)
             self.action_create_field.setEnabled(False)
 
@@ -395,10 +668,15 @@ class EditTrackingToolsPlugin:
             self.action_auto_toggle.setChecked(False)
             self.action_auto_toggle.blockSignals(False)
             self.action_auto_toggle.setText("Auto Edit (Enable Tracking)")
+
+            self.update_stats_for_active_layer()
             return
 
         is_tracked = vlayer.id() in self.tracked_layer_ids
-        has_fields = self._layer_has_required_fields(vlayer)
+        # Every action state below is False for untracked layers, so the
+        # fields enumeration can be skipped entirely when hopping through
+        # non-tracked table-of-contents entries.
+        has_fields = is_tracked and self._layer_has_required_fields(vlayer)
 
         self.action_auto_toggle.blockSignals(True)
         self.action_auto_toggle.setChecked(is_tracked)
@@ -411,6 +689,8 @@ class EditTrackingToolsPlugin:
         # Other tools only when tracking ON and fields exist
         self._set_tracking_tools_enabled(is_tracked and has_fields)
 
+        self.update_stats_for_active_layer()
+
     # ---------------- TRACKING TOGGLE ----------------
     def toggle_tracking_for_active_layer(self, checked: bool):
         layer = self._active_vector_layer()
@@ -463,35 +743,87 @@ class EditTrackingToolsPlugin:
         if layer.id() in self.auto_connections:
             return
 
-        fields = layer.fields()
-        edited_idx = fields.indexFromName(EDIT_FIELD)
-        date_idx = fields.indexFromName(DATE_FIELD)
+        edited_idx, date_idx = self._field_indexes(layer)
         if edited_idx == -1 or date_idx == -1:
             return
 
-        def mark_feature_edited(fid, geom):
+        # Auto-mark writes are coalesced: the edit signals only collect fids,
+        # and a short single-shot timer flushes the batch inside one edit
+        # command. A vertex drag touching many features then costs one undo
+        # entry and one stats refresh instead of one per signal.
+        pending_fids = set()
+        flush_timer = QTimer()
+        flush_timer.setSingleShot(True)
+        flush_timer.setInterval(50)
+
+        def drop_field_cache():
+            self._field_idx_cache.pop(layer.id(), None)
+            self._scanners.pop(layer.id(), None)
+
+        def mark_stats_dirty(*args):
+            self._invalidate_stats(layer.id())
+
+        def flush_pending():
+            if not pending_fids:
+                return
             if not layer.isEditable():
+                pending_fids.clear()
                 return
-            f = layer.getFeature(fid)
-            if f[edited_idx] in (None, 0):
-                layer.changeAttributeValue(fid, edited_idx, 1)
-                layer.changeAttributeValue(fid, date_idx, QDate.currentDate())
+            # one filtered request for the whole batch instead of a full
+            # getFeature (all attributes + geometry) per fid
+            req = _fast_request([edited_idx], with_geom=False).setFilterFids(list(pending_fids))
+            to_mark = [f.id() for f in layer.getFeatures(req) if f[edited_idx] in (None, 0)]
+            pending_fids.clear()
+            if not to_mark:
+                return
+
+            today = self._today or QDate.currentDate()
+            layer.beginEditCommand("Auto mark edited")
+            try:
+                for fid in to_mark:
+                    layer.changeAttributeValues(fid, {edited_idx: 1, date_idx: today})
+            finally:
+                layer.endEditCommand()
             self.update_stats_for_active_layer()
 
-        def mark_feature_added(fid):
+        def mark_feature_edited(fid, geom):
             if not layer.isEditable():
                 return
-            layer.changeAttributeValue(fid, edited_idx, 1)
-            layer.changeAttributeValue(fid, date_idx, QDate.currentDate())
-            self.update_stats_for_active_layer()
+            mark_stats_dirty()
+            pending_fids.add(fid)
+            flush_timer.start()
 
-        layer.geometryChanged.connect(mark_feature_edited)
-        layer.featureAdded.connect(mark_feature_added)
+        def mark_feature_added(fid):
+            if not layer.isEditable():
+                return
+            mark_stats_dirty()
+            pending_fids.add(fid)
+            flush_timer.start()
+
+        flush_timer.timeout.connect(flush_pending)
+
+        # Keep the QMetaObject.Connection handles so teardown can disconnect
+        # cleanly instead of probing each signal through try/except.
+        # attributeValueChanged/featuresDeleted invalidate the stats cache on
+        # any data mutation, including ones not initiated by this plugin
+        # (attribute table edits, deletes, undo).
+        # beforeCommitChanges drains the pending batch into the edit buffer
+        # before the commit processes it, so a save landing inside the 50 ms
+        # debounce window can't lose the last burst of auto-marks.
+        conns = [
+            layer.geometryChanged.connect(mark_feature_edited),
+            layer.featureAdded.connect(mark_feature_added),
+            layer.attributeValueChanged.connect(mark_stats_dirty),
+            layer.featuresDeleted.connect(mark_stats_dirty),
+            layer.updatedFields.connect(drop_field_cache),
+            layer.beforeCommitChanges.connect(flush_pending),
+        ]
 
         self.auto_connections[layer.id()] = {
             "layer": layer,
-            "geom_fn": mark_feature_edited,
-            "add_fn": mark_feature_added
+            "conns": conns,
+            "flush_timer": flush_timer,
+            "flush_fn": flush_pending
         }
 
     # ---------------- STATS DOCK ----------------
@@ -504,113 +836,319 @@ class EditTrackingToolsPlugin:
         self.stats_label.setWordWrap(True)
         layout.addWidget(self.stats_label)
 
+        # One plain-text (non-rich) label per counter. Each is updated
+        # individually and only when its value changed, so the auto-edit
+        # refresh stream never re-parses HTML or relayouts the whole dock.
+        self._stat_rows = QWidget()
+        rows = QVBoxLayout(self._stat_rows)
+        rows.setContentsMargins(0, 0, 0, 0)
+
+        def stat_row(caption, color=None):
+            style = "font-weight: bold;"
+            if color:
+                style += f" color: {color};"
+            cap = QLabel(caption)
+            cap.setStyleSheet(style)
+            cap.setTextFormat(Qt.PlainText)
+            val = QLabel("0")
+            val.setStyleSheet(style)
+            val.setTextFormat(Qt.PlainText)
+            row = QHBoxLayout()
+            row.addWidget(cap)
+            row.addWidget(val)
+            row.addStretch()
+            rows.addLayout(row)
+            return cap, val
+
+        _, self.lbl_total = stat_row("Total:")
+        _, self.lbl_e1 = stat_row("Edited (1):")
+        _, self.lbl_e0 = stat_row("Not Edited (0):")
+        self.lbl_day_caption, self.lbl_day = stat_row("Day Count:")
+        _, self.lbl_null_geom = stat_row("Null Geometry:", color="red")
+        _, self.lbl_null_attr = stat_row("Null Attributes:", color="red")
+
+        self._stat_rows.setVisible(False)
+        layout.addWidget(self._stat_rows)
+
         row = QHBoxLayout()
         lbl = QLabel("Day Count Date:")
         self.day_date_edit = QDateEdit()
         self.day_date_edit.setCalendarPopup(True)
         self.day_date_edit.setDate(QDate.currentDate())
-        self.day_date_edit.dateChanged.connect(self.update_stats_for_active_layer)
+
+        # dateChanged fires on every spinner tick and typed digit; debounce so
+        # only the final value triggers a refresh
+        self._date_debounce = QTimer(self.dock)
+        self._date_debounce.setSingleShot(True)
+        self._date_debounce.setInterval(150)
+        self._date_debounce.timeout.connect(self.update_stats_for_active_layer)
+        self.day_date_edit.dateChanged.connect(lambda *_: self._date_debounce.start())
         row.addWidget(lbl)
         row.addWidget(self.day_date_edit)
         row.addStretch()
         layout.addLayout(row)
 
         self.dock.setWidget(content)
+        self.dock.visibilityChanged.connect(self._on_dock_visibility_changed)
         self.iface.addDockWidget(Qt.RightDockWidgetArea, self.dock)
 
         self.update_stats_for_active_layer()
 
-    # ---- Throttled stats update ----
-    def update_stats_for_active_layer(self, *args):
-        if not self._stats_timer.isActive():
-            self._stats_timer.start(250)
-
-    def _update_stats_now(self):
-        layer = self.iface.activeLayer()
+    def _on_dock_visibility_changed(self, visible):
+        if visible and self._stats_dirty:
+            self._stats_timer.start(0)
 
+    # ---- Throttled stats update ----
+    def _set_header(self, text):
+        if self._last_stats.get("header") != text:
+            self._last_stats["header"] = text
+            self.stats_label.setText(text)
+
+    def _set_stat(self, label, key, value):
+        if self._last_stats.get(key) != value:
+            self._last_stats[key] = value
+            label.setText(str(value))
+
+    def _update_stats_header(self, layer) -> bool:
+        """Render the cheap, scan-free states. Returns True when fully handled."""
+        text = None
         if not layer:
-            self.stats_label.setText("No active layer.")
-            return
-
-        if not isinstance(layer, QgsVectorLayer):
-            self.stats_label.setText(
+            text = "No active layer."
+        elif not isinstance(layer, QgsVectorLayer):
+            text = (
                 f"<b>Layer:</b> {layer.name()}<br>"
                 f"<span style='color:#666;'>Raster/non-vector layer — tracking not applicable.</span>"
             )
-            return
-
-        tracked = layer.id() in self.tracked_layer_ids
-        if not tracked:
-            self.stats_label.setText(
+        elif layer.id() not in self.tracked_layer_ids:
+            text = (
                 f"<b>Layer:</b> {layer.name()}<br>"
                 f"<b>Tracking:</b> OFF<br>"
                 f"<span style='color:#666;'>Click Auto Edit to enable tracking and view stats.</span>"
             )
-            return
-
-        fields = layer.fields()
-        edited_idx = fields.indexFromName(EDIT_FIELD)
-        date_idx = fields.indexFromName(DATE_FIELD)
-
-        if edited_idx == -1 or date_idx == -1:
-            self.stats_label.setText(
+        elif not self._layer_has_required_fields(layer):
+            text = (
                 f"<b>Layer:</b> {layer.name()}<br>"
                 f"<b>Tracking:</b> ON<br>"
                 f"<span style='color:red;'>Required fields missing.</span><br>"
                 f"<span style='color:#666;'>Click 'Create Edited Fields and Date'.</span>"
             )
+
+        if text is None:
+            return False
+
+        self._set_header(text)
+        if self._stat_rows is not None:
+            self._stat_rows.setVisible(False)
+        return True
+
+    def force_refresh_stats(self, *args):
+        # The toolbar button is an explicit "rescan now": drop the cached
+        # counters first so changes no edit signal reported (another client
+        # writing to the same database table, bulk provider tools) show up.
+        layer = self.iface.activeLayer()
+        if isinstance(layer, QgsVectorLayer):
+            self._invalidate_stats(layer.id())
+        self.update_stats_for_active_layer()
+
+    def update_stats_for_active_layer(self, *args):
+        # Gate at the scheduler too: with the dock closed, skip even the
+        # header work and the timer churn; catch up via visibilityChanged.
+        if self.dock is None or not self.dock.isVisible():
+            self._stats_dirty = True
             return
 
-        selected_day = self.day_date_edit.date() if self.day_date_edit else QDate.currentDate()
+        layer = self.iface.activeLayer()
 
-        total = edited_1 = edited_0 = null_geom = null_attr = day_count = 0
+        # Leading edge: scan-free states update immediately.
+        if self._update_stats_header(layer):
+            self._stats_timer.stop()
+            return
 
-        for f in layer.getFeatures():
-            total += 1
-            g = f.geometry()
-            if g is None or g.isEmpty() or g.isNull():
-                null_geom += 1
-                continue
+        # Trailing edge: restart the single-shot timer on every trigger so a
+        # burst of edit signals coalesces into one scan after the burst ends.
+        # Large layers get a longer quiet period before rescanning.
+        timeout = 250 if layer.featureCount() < 50000 else 1000
+        self._stats_timer.start(timeout)
 
-            val = f[edited_idx]
-            date_val = f[date_idx]
-            date_null = is_null_date(date_val)
+    def _update_stats_now(self):
+        # No work for a panel the user can't see; catch up on visibility.
+        if self.dock is None or not self.dock.isVisible():
+            self._stats_dirty = True
+            return
+        self._stats_dirty = False
 
-            if val is None:
-                null_attr += 1
-                continue
+        layer = self.iface.activeLayer()
 
-            try:
-                v = int(val)
-            except Exception:
-                null_attr += 1
-                continue
+        if self._update_stats_header(layer):
+            return
 
-            if v not in (0, 1):
-                null_attr += 1
-                continue
+        selected_day = self.day_date_edit.date() if self.day_date_edit else QDate.currentDate()
 
-            if v == 1:
-                if date_null:
-                    null_attr += 1
-                else:
-                    edited_1 += 1
-                    qd = to_qdate(date_val)
-                    if qd is not None and qd == selected_day:
-                        day_count += 1
-            else:
-                edited_0 += 1
+        # Rescan only when the cache was invalidated by an edit signal;
+        # changing the day picker alone is an O(1) histogram lookup.
+        stats = self._stats_cache.get(layer.id())
+        if stats is None:
+            self._start_stats_worker(layer)
+            return
 
-        self.stats_label.setText(
+        date_hist = stats["date_hist"]
+        if date_hist is None:
+            # aggregate-backed stats: day count is a single pushed-down COUNT
+            day_expr = (f'"{EDIT_FIELD}" = 1 AND "{DATE_FIELD}" = '
+                        f"to_date('{selected_day.toString('yyyy-MM-dd')}')")
+            day_count = self._aggregate_count(layer, day_expr) or 0
+        else:
+            day_count = date_hist.get(selected_day.toJulianDay(), 0)
+
+        self._set_header(
             f"<b>Layer:</b> {layer.name()}<br>"
-            f"<b>Tracking:</b> ON<br>"
-            f"<b>Total:</b> {total}<br>"
-            f"<b>Edited (1):</b> {edited_1}<br>"
-            f"<b>Not Edited (0):</b> {edited_0}<br>"
-            f"<b>Day Count ({selected_day.toString('yyyy-MM-dd')}):</b> {day_count}<br>"
-            f"<b style='color:red;'>Null Geometry:</b> <b style='color:red;'>{null_geom}</b><br>"
-            f"<b style='color:red;'>Null Attributes:</b> <b style='color:red;'>{null_attr}</b>"
+            f"<b>Tracking:</b> ON"
         )
+        self._stat_rows.setVisible(True)
+        self._set_stat(self.lbl_total, "total", stats["total"])
+        self._set_stat(self.lbl_e1, "edited_1", stats["edited_1"])
+        self._set_stat(self.lbl_e0, "edited_0", stats["edited_0"])
+        self._set_stat(self.lbl_day_caption, "day_caption",
+                       f"Day Count ({selected_day.toString('yyyy-MM-dd')}):")
+        self._set_stat(self.lbl_day, "day_count", day_count)
+        self._set_stat(self.lbl_null_geom, "null_geom", stats["null_geom"])
+        self._set_stat(self.lbl_null_attr, "null_attr", stats["null_attr"])
+
+    @staticmethod
+    def _aggregate_count(layer, filter_expr):
+        """Filtered feature count, or None when the aggregate fails."""
+        params = QgsAggregateCalculator.AggregateParameters()
+        params.filter = filter_expr
+        # $id: never NULL and compiles to the fid/pk column in backend SQL
+        result, ok = layer.aggregate(QgsAggregateCalculator.Count, "$id", params)
+        if not ok:
+            return None
+        try:
+            return int(result)
+        except Exception:
+            return None
+
+    def _aggregate_layer_stats(self, layer: QgsVectorLayer):
+        """Counters via filtered COUNT aggregates executed by the backend.
+
+        Unlike the scan, the attribute buckets here do not exclude
+        NULL-geometry rows (that predicate does not push down); for database
+        layers such rows are the rare degenerate case the NULL Geometry
+        counter exists to expose. date_hist is None — day counts are
+        aggregated on demand by _update_stats_now. Returns None when any
+        aggregate fails so the caller can fall back to the scan.
+        """
+        edited_1 = self._aggregate_count(
+            layer, f'"{EDIT_FIELD}" = 1 AND "{DATE_FIELD}" IS NOT NULL')
+        edited_0 = self._aggregate_count(layer, f'"{EDIT_FIELD}" = 0')
+        null_attr = self._aggregate_count(
+            layer,
+            f'"{EDIT_FIELD}" IS NULL OR "{EDIT_FIELD}" NOT IN (0, 1) '
+            f'OR ("{EDIT_FIELD}" = 1 AND "{DATE_FIELD}" IS NULL)')
+        null_geom = self._aggregate_count(layer, '$geometry IS NULL')
+
+        if None in (edited_1, edited_0, null_attr, null_geom):
+            return None
+
+        return {
+            "total": layer.featureCount(),
+            "edited_1": edited_1,
+            "edited_0": edited_0,
+            "null_geom": null_geom,
+            "null_attr": null_attr,
+            "date_hist": None,
+        }
+
+    def _scan_layer_stats(self, layer: QgsVectorLayer):
+        """Full-table scan producing the cached counters + per-day histogram."""
+        if layer.dataProvider().name() in DB_PROVIDERS:
+            stats = self._aggregate_layer_stats(layer)
+            if stats is not None:
+                return stats
+
+        edited_idx, date_idx = self._field_indexes(layer)
+
+        edited_1 = edited_0 = null_geom = null_attr = 0
+        date_hist = Counter()
+
+        # only the two tracking fields are read; skip the rest of the attribute table
+        req = _fast_request([edited_idx, date_idx])
+
+        # Pre-bind hot-loop lookups: LOAD_FAST instead of LOAD_GLOBAL/LOAD_ATTR
+        # per feature, and `type(val) is int` short-circuits the int() cast
+        # (the provider returns native ints for a QVariant.Int field).
+        # QDate values take an inline branch to skip the call entirely.
+        _to_jd = to_julian_day
+        _QDate = QDate
+
+        np = _get_numpy()
+        if np is not None:
+            # Single pass collecting compact columns, then count in C via
+            # boolean masks instead of per-feature Python branches.
+            edited_vals = []
+            date_jds = []
+            ev_append = edited_vals.append
+            jd_append = date_jds.append
+            for f in layer.getFeatures(req):
+                g = f.geometry()
+                if g is None or g.isEmpty() or g.isNull():
+                    null_geom += 1
+                    continue
+
+                val = f[edited_idx]
+                if type(val) is int:
+                    v = val
+                elif val is None:
+                    v = -1
+                else:
+                    try:
+                        v = int(val)
+                    except Exception:
+                        v = -1
+                ev_append(v if v in (0, 1) else -1)
+
+                dv = f[date_idx]
+                if type(dv) is _QDate:
+                    jd_append(dv.toJulianDay() if dv.isValid() else -1)
+                else:
+                    jd_append(_to_jd(dv))
+
+            edited_arr = np.fromiter(edited_vals, dtype=np.int8, count=len(edited_vals))
+            date_arr = np.fromiter(date_jds, dtype=np.int32, count=len(date_jds))
+
+            is_1 = edited_arr == 1
+            has_date = date_arr >= 0
+            edited_0 = int((edited_arr == 0).sum())
+            edited_1 = int((is_1 & has_date).sum())
+            null_attr = int(((edited_arr < 0) | (is_1 & ~has_date)).sum())
+            date_hist = Counter(date_arr[is_1 & has_date].tolist())
+        else:
+            # Specialize the loop on the layer's runtime value types, sampled
+            # from the first feature and cached until updatedFields.
+            it = layer.getFeatures(req)
+            first = next(it, None)
+            if first is not None:
+                scanner = self._scanners.get(layer.id())
+                if scanner is None:
+                    scanner = _make_scanner(type(first[edited_idx]), type(first[date_idx]))
+                    self._scanners[layer.id()] = scanner
+                edited_1, edited_0, null_geom, null_attr, date_hist = scanner(
+                    chain([first], it), edited_idx, date_idx)
+
+        # featureCount() is O(1) for most providers; -1 means unknown, in
+        # which case the scanned tally covers every feature anyway.
+        total = layer.featureCount()
+        if total < 0:
+            total = null_geom + null_attr + edited_1 + edited_0
+
+        return {
+            "total": total,
+            "edited_1": edited_1,
+            "edited_0": edited_0,
+            "null_geom": null_geom,
+            "null_attr": null_attr,
+            "date_hist": date_hist,
+        }
 
     # ---------------- TOOL 1: CREATE FIELDS ----------------
     def create_edited_fields(self):
@@ -631,7 +1169,11 @@ class EditTrackingToolsPlugin:
 
         new_fields = []
         if fields.indexFromName(EDIT_FIELD) == -1:
-            new_fields.append(QgsField(EDIT_FIELD, QVariant.Int, "integer"))
+            edit_field = QgsField(EDIT_FIELD, QVariant.Int, "integer")
+            # default 0 so providers that support column defaults pre-fill
+            # rows server-side; the date field's implicit default is NULL
+            edit_field.setDefaultValueDefinition(QgsDefaultValue("0"))
+            new_fields.append(edit_field)
         if fields.indexFromName(DATE_FIELD) == -1:
             new_fields.append(QgsField(DATE_FIELD, QVariant.Date, "date"))
 
@@ -640,14 +1182,15 @@ class EditTrackingToolsPlugin:
             layer.updateFields()
 
         # refresh indexes
-        fields = layer.fields()
-        edited_idx = fields.indexFromName(EDIT_FIELD)
-        date_idx = fields.indexFromName(DATE_FIELD)
+        edited_idx, date_idx = self._field_indexes(layer)
 
-        # initialize all features (important)
-        for f in layer.getFeatures():
-            layer.changeAttributeValue(f.id(), edited_idx, 0)
-            layer.changeAttributeValue(f.id(), date_idx, None)
+        # initialize all features (important) — one provider call, not 2N edit-buffer ops
+        req = _fast_request(with_geom=False)
+        ids = [f.id() for f in layer.getFeatures(req)]
+        pr.changeAttributeValues({fid: {edited_idx: 0, date_idx: None} for fid in ids})
+        layer.reload()
+        # provider-level writes emit no layer signals; invalidate explicitly
+        self._invalidate_stats(layer.id())
 
         # attach watcher now that fields exist
         self._attach_auto_for_layer(layer)
@@ -665,23 +1208,28 @@ class EditTrackingToolsPlugin:
         if not layer or layer.id() not in self.tracked_layer_ids or not self._layer_has_required_fields(layer):
             self.iface.messageBar().pushWarning("Edit Tracking", "Tracking ON + fields required.")
             return
-        if not layer.selectedFeatureIds():
+        sel_ids = layer.selectedFeatureIds()
+        if not sel_ids:
             self.iface.messageBar().pushWarning("Edit Tracking", "No selection.")
             return
         if not layer.isEditable():
             layer.startEditing()
 
-        fields = layer.fields()
-        edited_idx = fields.indexFromName(EDIT_FIELD)
-        date_idx = fields.indexFromName(DATE_FIELD)
+        edited_idx, date_idx = self._field_indexes(layer)
 
         today = QDate.currentDate()
-        n = 0
-        for f in layer.selectedFeatures():
-            if f[edited_idx] in (None, 0):
-                layer.changeAttributeValue(f.id(), edited_idx, 1)
-                layer.changeAttributeValue(f.id(), date_idx, today)
-                n += 1
+        # read phase: fetch only the edited flag for the selection, no geometry
+        req = _fast_request([edited_idx], with_geom=False).setFilterFids(sel_ids)
+        fids = [f.id() for f in layer.getFeatures(req) if f[edited_idx] in (None, 0)]
+
+        # write phase: one undo entry for the whole batch
+        layer.beginEditCommand("Mark selected edited")
+        try:
+            for fid in fids:
+                layer.changeAttributeValues(fid, {edited_idx: 1, date_idx: today})
+        finally:
+            layer.endEditCommand()
+        n = len(fids)
         self.iface.messageBar().pushSuccess("Edit Tracking", f"Updated {n} selected.")
         self.update_stats_for_active_layer()
 
@@ -721,18 +1269,25 @@ class EditTrackingToolsPlugin:
         if not layer.isEditable():
             layer.startEditing()
 
-        fields = layer.fields()
-        edited_idx = fields.indexFromName(EDIT_FIELD)
-        date_idx = fields.indexFromName(DATE_FIELD)
+        edited_idx, date_idx = self._field_indexes(layer)
 
-        n = 0
-        for f in layer.selectedFeatures():
+        # read phase: only the geometry is needed here (NULL check)
+        req = _fast_request().setFilterFids(layer.selectedFeatureIds())
+        fids = []
+        for f in layer.getFeatures(req):
             g = f.geometry()
             if g is None or g.isEmpty() or g.isNull():
                 continue
-            layer.changeAttributeValue(f.id(), edited_idx, 1)
-            layer.changeAttributeValue(f.id(), date_idx, sel_date)
-            n += 1
+            fids.append(f.id())
+
+        # write phase: one undo entry for the whole batch
+        layer.beginEditCommand("Update edited date")
+        try:
+            for fid in fids:
+                layer.changeAttributeValues(fid, {edited_idx: 1, date_idx: sel_date})
+        finally:
+            layer.endEditCommand()
+        n = len(fids)
 
         self.iface.messageBar().pushSuccess("Edit Tracking", f"Updated {n} features.")
         self.update_stats_for_active_layer()
@@ -746,13 +1301,22 @@ class EditTrackingToolsPlugin:
         if not layer.isEditable():
             layer.startEditing()
 
-        ids = []
-        for f in layer.getFeatures():
+        # geometry-only scan: no attributes need to be materialized.
+        # ids are fully collected before mutating so the iterator is never
+        # invalidated mid-scan (int64 array keeps the fids unboxed).
+        ids = array("q")
+        for f in layer.getFeatures(_fast_request()):
             g = f.geometry()
             if g is None or g.isEmpty() or g.isNull():
                 ids.append(f.id())
-        for fid in ids:
-            layer.deleteFeature(fid)
+
+        if ids:
+            # one bulk call, one undo entry
+            layer.beginEditCommand("Remove NULL geometry")
+            try:
+                layer.deleteFeatures(ids.tolist())
+            finally:
+                layer.endEditCommand()
 
         self.iface.messageBar().pushSuccess("Edit Tracking", f"Removed {len(ids)} NULL geometry features.")
         self.update_stats_for_active_layer()
@@ -764,38 +1328,24 @@ class EditTrackingToolsPlugin:
             self.iface.messageBar().pushWarning("Edit Tracking", "Tracking ON + fields required.")
             return
 
-        fields = layer.fields()
-        edited_idx = fields.indexFromName(EDIT_FIELD)
-        date_idx = fields.indexFromName(DATE_FIELD)
-
         layer.removeSelection()
-        null_ids = []
-
-        for f in layer.getFeatures():
+        # int64 array: unboxed fids instead of a list of Python ints
+        null_ids = array("q")
+
+        # The attribute predicate runs in the provider (compiled to SQL where
+        # supported), so Python only sees matching features — and touches
+        # them solely to keep NULL-geometry rows out of the selection.
+        expr = (f'"{EDIT_FIELD}" IS NULL OR "{EDIT_FIELD}" NOT IN (0, 1) '
+                f'OR ("{EDIT_FIELD}" = 1 AND "{DATE_FIELD}" IS NULL)')
+        req = _fast_request().setFilterExpression(expr)
+        for f in layer.getFeatures(req):
             g = f.geometry()
             if g is None or g.isEmpty() or g.isNull():
                 continue
-
-            val = f[edited_idx]
-            date_val = f[date_idx]
-            date_null = is_null_date(date_val)
-
-            if val is None:
-                null_ids.append(f.id())
-                continue
-            try:
-                v = int(val)
-            except Exception:
-                null_ids.append(f.id())
-                continue
-            if v not in (0, 1):
-                null_ids.append(f.id())
-                continue
-            if v == 1 and date_null:
-                null_ids.append(f.id())
+            null_ids.append(f.id())
 
         if null_ids:
-            layer.selectByIds(null_ids)
+            layer.selectByIds(null_ids.tolist())
             self.iface.messageBar().pushSuccess("Edit Tracking", f"Selected {len(null_ids)} NULL attribute features.")
         else:
             self.iface.messageBar().pushInfo("Edit Tracking", "No NULL attributes found.")